@@ -3,7 +3,12 @@ from typing import Union
 from calculate_anything.calculation.base import Calculation
 from calculate_anything.query.result import QueryResult
 from calculate_anything.lang import LanguageService
-from calculate_anything.utils import multi_re, images_dir
+from calculate_anything.utils import images_dir
+from calculate_anything.regex import (
+    CALCULATOR_FORMAT_IMAGINARY_RE,
+    CALCULATOR_FORMAT_SPLIT_RE,
+    CALCULATOR_FORMAT_REPLACE,
+)
 
 
 __all__ = ['CalculatorCalculation', 'BooleanCalculation']
@@ -35,25 +40,12 @@ class CalculatorCalculation(Calculation):
                 return 'i'
             return group.replace('j', 'i')
 
-        replace_special = {
-            '%': 'mod',
-            '//': 'div',
-            '**': '^',
-            '*': '×',
-            'sqrt': '√',
-            'pi': 'π',
-            'tau': 'τ',
-            '==': '=',
-        }
-
         query = self.query
-        query = re.sub(r'\d+j', sub_i, query)
-        query = re.split(
-            r'(\/\/|\*\*|\=\=|\>\=|\<\=|[\+\-\/\*\%\^\>\<])', query
-        )
+        query = CALCULATOR_FORMAT_IMAGINARY_RE.sub(sub_i, query)
+        query = CALCULATOR_FORMAT_SPLIT_RE.split(query)
         query = map(str.strip, query)
         query = ' '.join(query)
-        query = multi_re.sub_dict(replace_special, query, sort=True)
+        query = CALCULATOR_FORMAT_REPLACE.sub_dict(query)
         return query
 
     def format(self) -> str:
@@ -19,9 +19,14 @@ from calculate_anything import logging
 from calculate_anything.calculation.base import Calculation
 from calculate_anything.query.result import QueryResult
 from calculate_anything.lang import LanguageService
-from calculate_anything.utils import multi_re, images_dir
+from calculate_anything.utils import images_dir
 from calculate_anything.constants import FLAGS, TIME_DATETIME_FORMAT_NUMBERS
-from calculate_anything.regex import UNIT_CURRENCY_RE
+from calculate_anything.regex import (
+    UNIT_CURRENCY_RE,
+    UNIT_DIMENSIONALITY_RE,
+    UNIT_FORMAT_REPLACE,
+    UNIT_CURRENCY_FORMAT_REPLACE,
+)
 
 
 __all__ = [
@@ -121,10 +126,8 @@ class UnitsCalculation(Calculation):
 
         if not self.value.dimensionless:
             dimensionality = str(self.value.dimensionality)
-            dimensionality = re.sub(
-                r'\[(.*?)\]',
-                lambda s: translator(s.group(0)[1:-1]),
-                dimensionality,
+            dimensionality = UNIT_DIMENSIONALITY_RE.sub(
+                lambda s: translator(s.group(0)[1:-1]), dimensionality
             )
         else:
             dimensionality = ''
@@ -136,9 +139,8 @@ class UnitsCalculation(Calculation):
         else:
             description = ''
 
-        replace_re = multi_re.compile({'**': '^', '_': ' '}, sort=False)
-        name = replace_re.sub_dict(name)
-        description = replace_re.sub_dict(description)
+        name = UNIT_FORMAT_REPLACE.sub_dict(name)
+        description = UNIT_FORMAT_REPLACE.sub_dict(description)
 
         return name, description
 
@@ -194,7 +196,7 @@ class TemperatureUnitsCalculation(UnitsCalculation):
             unit_name = str(self.value.units)
             name = '{:g} {}'.format(self.value.magnitude, unit_name)
 
-        name = multi_re.sub_dict({'**': '^', '_': ' '}, name, sort=False)
+        name = UNIT_FORMAT_REPLACE.sub_dict(name)
         return name, '[temperature]'
 
 
@@ -233,17 +235,13 @@ class CurrencyUnitsCalculation(UnitsCalculation):
                 return currency
             return '{} ({})'.format(currency, currency_alias)
 
-        replace_re = multi_re.compile(
-            {'currency_': '', '**': '^', '_': ' '}, sort=True
-        )
+        replace_re = UNIT_CURRENCY_FORMAT_REPLACE
 
         unit_name = str(self.value.units)
         clipboard = replace_re.sub_dict(unit_name)
 
         if babel_units is not None:
-            unit_name = re.sub(
-                r'currency_([a-zA-Z]{3,})', currency_alias_f, unit_name
-            )
+            unit_name = UNIT_CURRENCY_RE.sub(currency_alias_f, unit_name)
         else:
             unit_name = clipboard
 
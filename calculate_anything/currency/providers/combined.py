@@ -1,4 +1,5 @@
 import sys
+from copy import copy
 from typing import Iterable, List, Type
 
 if sys.version_info[:2] < (3, 7):
@@ -70,6 +71,12 @@ class CombinedCurrencyProvider(ApiKeyCurrencyProvider):
                 del self._api_providers[provider_cls]
         return self
 
+    def snapshot(self) -> 'CombinedCurrencyProvider':
+        provider = copy(self)
+        provider._free_providers = OrderedDict(self._free_providers)
+        provider._api_providers = OrderedDict(self._api_providers)
+        return provider
+
     def _thread_request(
         self,
         provider_cls: Type[CurrencyProvider],
@@ -66,22 +66,34 @@ class UpdateThread(Thread):
         self.wake()
 
     def _get_currencies(self, *currencies: str, force: bool) -> CurrencyData:
-        if force:
-            pass
-        elif self._cache.enabled and not self._cache.should_update():
-            return self._cache.get_rates(*currencies)
-
+        with self._lock:
+            if force:
+                pass
+            elif self._cache.enabled and not self._cache.should_update():
+                return self._cache.get_rates(*currencies)
+            provider = self._provider.snapshot()
+
+        # Request from a snapshot of the providers without holding the lock,
+        # queries read the service state and would otherwise wait for the
+        # network round-trip while preferences may change the providers
         self._logger.info('Will load currencies')
-        self._cache.clear()
-        currency_rates = self._provider.request_currencies(
-            *currencies, force=force
-        )
-        if not self._stopped_event.is_set():
-            provider_name = self._provider.__class__.__name__
-            self._cache.save(currency_rates, provider_name)
+        try:
+            currency_rates = provider.request_currencies(
+                *currencies, force=force
+            )
+        finally:
+            with self._lock:
+                self._provider.had_error = provider.had_error
+                timestamp = provider.last_request_timestamp
+                self._provider.last_request_timestamp = timestamp
+
+        with self._lock:
+            self._cache.clear()
+            if not self._stopped_event.is_set():
+                provider_name = self._provider.__class__.__name__
+                self._cache.save(currency_rates, provider_name)
         return currency_rates
 
-    @with_lock
     def _run(self, force: bool) -> float:
         next_update = 60.0
 
@@ -91,12 +103,13 @@ class UpdateThread(Thread):
         except Exception as e:
             self._logger.exception('Could not get currencies: {}'.format(e))
 
-        with safe_operation():
-            self._callback(currency_rates, self._provider.had_error)
+        with self._lock:
+            with safe_operation():
+                self._callback(currency_rates, self._provider.had_error)
 
-        if not self._provider.had_error:
-            cache_next_update = self._cache.next_update_seconds()
-            next_update = max(next_update, cache_next_update)
+            if not self._provider.had_error:
+                cache_next_update = self._cache.next_update_seconds()
+                next_update = max(next_update, cache_next_update)
         return next_update
 
     def run(self) -> None:
@@ -222,11 +222,12 @@ class CalculatorQueryHandler(QueryHandler, metaclass=Singleton):
         except (SyntaxError, TypeError):
             return None
         except (NameNotDefined, FeatureNotAvailable, FunctionNotDefined) as e:
-            logger.debug(
-                'Got simpleval Exception: when calculating {!r}: {}'.format(
-                    query, e
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    'Got simpleval Exception: when calculating {!r}: {}'.format(
+                        query, e
+                    )
                 )
-            )
             return None
         except Exception as e:  # pragma: no cover
             logger.exception(
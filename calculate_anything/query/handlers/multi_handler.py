@@ -1,5 +1,5 @@
+from operator import attrgetter
 from calculate_anything.query.handlers.base import QueryHandler
-import inspect
 from typing import List, Type, Union
 from calculate_anything.calculation.base import Calculation
 from calculate_anything.query.result import QueryResult
@@ -24,18 +24,22 @@ __all__ = ['MultiHandler']
 logger = logging.getLogger(__name__)
 
 
+_ORDER_KEY = attrgetter('order')
+
+
 class MultiHandler:
     def __init__(self) -> None:
         self._handlers = [
-            UnitsQueryHandler,
-            CalculatorQueryHandler,
-            PercentagesQueryHandler,
-            TimeQueryHandler,
-            Base10QueryHandler,
-            Base16QueryHandler,
-            Base2QueryHandler,
-            Base8QueryHandler,
+            UnitsQueryHandler(),
+            CalculatorQueryHandler(),
+            PercentagesQueryHandler(),
+            TimeQueryHandler(),
+            Base10QueryHandler(),
+            Base16QueryHandler(),
+            Base2QueryHandler(),
+            Base8QueryHandler(),
         ]
+        self._handlers_by_class = {type(h): h for h in self._handlers}
 
     def _handle(
         self,
@@ -49,8 +53,11 @@ class MultiHandler:
             handlers = self._handlers
 
         for handler in handlers:
-            if inspect.isclass(handler):
-                handler = handler()
+            if isinstance(handler, type):
+                handler_class = handler
+                handler = self._handlers_by_class.get(handler_class)
+                if handler is None:
+                    handler = handler_class()
             try:
                 result = handler.handle(query)
             except Exception as e:  # pragma: no cover
@@ -62,11 +69,12 @@ class MultiHandler:
 
             if not result:
                 continue
-            if not return_raw:
-                result = map(lambda r: r.to_query_result(), result)
-            results.extend(result)
+            if return_raw:
+                results.extend(result)
+            else:
+                results.extend(r.to_query_result() for r in result)
 
-        return sorted(results, key=lambda result: result.order)
+        return sorted(results, key=_ORDER_KEY)
 
     def handle_raw(
         self, query: str, *handlers: Union[Type[QueryHandler], QueryHandler]
@@ -1,6 +1,5 @@
 from typing import List, Optional, Tuple, Union
 from calculate_anything.calculation.base import CalculationError
-import re
 import pytz
 from datetime import datetime, timedelta
 
@@ -29,6 +28,7 @@ from calculate_anything.regex import (
     TIME_QUERY_REGEX_SPLIT,
     TIME_SUBQUERY_REGEX,
     TIME_SPLIT_REGEX,
+    TIME_NUMBER_ONLY_REGEX,
     PLUS_MINUS_REGEX,
     TIME_LOCATION_REPLACE_REGEX,
 )
@@ -72,7 +72,7 @@ class TimeQueryHandler(QueryHandler, metaclass=Singleton):
             return None, None, None, None, False
 
         date, flags, _, _, parsed_query = date[0]
-        match = re.match(r'^\s*\d+\.?(\d+)?\s*$', parsed_query) is None
+        match = TIME_NUMBER_ONLY_REGEX.match(parsed_query) is None
         overflow = flags == parsedatetime.pdtContext(0) and match
         td = date - reference_datetime
         return date, td, parsed_query, match, overflow
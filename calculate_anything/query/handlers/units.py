@@ -19,7 +19,11 @@ from calculate_anything.calculation import (
 from calculate_anything.lang import LanguageService
 from calculate_anything import logging
 from calculate_anything.utils import Singleton, is_types, images_dir
-from calculate_anything.regex import UNIT_QUERY_SPLIT_RE, UNIT_SPLIT_RE
+from calculate_anything.regex import (
+    UNIT_QUERY_SPLIT_RE,
+    UNIT_SPLIT_RE,
+    UNIT_ARITHMETIC_ONLY_RE,
+)
 from calculate_anything.exceptions import (
     CurrencyProviderException,
     ExtendedException,
@@ -186,11 +190,12 @@ class UnitsQueryHandler(QueryHandler, metaclass=Singleton):
             pint.errors.UndefinedUnitError,
             pint.errors.DefinitionSyntaxError,
         ) as e:
-            logger.debug(
-                'Got pint exception when trying to parse {!r}: {}'.format(
-                    expression, e
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    'Got pint exception when trying to parse {!r}: {}'.format(
+                        expression, e
+                    )
                 )
-            )
         except Exception as e:  # pragma: no cover
             logger.exception(
                 'Got exception when trying to parse: {!r}: {}'.format(
@@ -228,6 +233,9 @@ class UnitsQueryHandler(QueryHandler, metaclass=Singleton):
         ureg = UnitsService().unit_registry
         base_currency = UnitsService().base_currency
         unit_from, units_to = UnitsQueryHandler._extract_query(query)
+        # Plain arithmetic has no units to convert, leave it to the calculator
+        if UNIT_ARITHMETIC_ONLY_RE.match(unit_from):
+            return None
 
         parse_err = None
         unit_from_ureg_currency = None
@@ -301,61 +309,64 @@ class UnitsQueryHandler(QueryHandler, metaclass=Singleton):
             units_to_ureg = map(lambda u: u.units, units_to_ureg)
 
         added_currency = False
-        for unit_from_ureg, unit_to_ureg in product(
-            units_from_ureg, units_to_ureg
-        ):
-            try:
-                if not unit_from_ureg.is_compatible_with(unit_to_ureg):
-                    continue
-                unit_converted = unit_from_ureg.to(unit_to_ureg, 'currency')
-                if math.isnan(unit_converted.magnitude):
-                    logger.warning(
-                        'Converted magnitude is NaN'
-                        ': from={} {}, to={}'.format(
-                            unit_from_ureg.magnitude,
-                            unit_from_ureg.units,
-                            unit_to_ureg,
+        # Switch to the currency context once for all the conversions
+        # instead of once per conversion, it costs more than converting
+        with ureg.context('currency'):
+            for unit_from_ureg, unit_to_ureg in product(
+                units_from_ureg, units_to_ureg
+            ):
+                try:
+                    if not unit_from_ureg.is_compatible_with(unit_to_ureg):
+                        continue
+                    unit_converted = unit_from_ureg.to(unit_to_ureg)
+                    if math.isnan(unit_converted.magnitude):
+                        logger.warning(
+                            'Converted magnitude is NaN'
+                            ': from={} {}, to={}'.format(
+                                unit_from_ureg.magnitude,
+                                unit_from_ureg.units,
+                                unit_to_ureg,
+                            )
                         )
-                    )
+                        continue
+                    Q = ureg.Quantity
+                    rate = Q(1, unit_from_ureg.units)
+                    rate = rate.to(Q(1, unit_converted.units))
+                except Exception as e:  # pragma: no cover
+                    msg = 'Unexpected exception uni units conversion: {!r}: {}'
+                    msg = msg.format(original_query, e)
+                    logger.exception(msg)
                     continue
-                Q = ureg.Quantity
-                rate = Q(1, unit_from_ureg.units)
-                rate = rate.to(Q(1, unit_converted.units), 'currency')
-            except Exception as e:  # pragma: no cover
-                msg = 'Unexpected exception uni units conversion: {!r}: {}'
-                msg = msg.format(original_query, e)
-                logger.exception(msg)
-                continue
-
-            kwargs = {}
-            if UnitsCalculation.is_currency(unit_converted):
-                added_currency = True
-                # Continue in if same units, it will be added later
-                if unit_converted.units == unit_from_ureg.units:
-                    continue
-                UnitClass = CurrencyUnitsCalculation
-                timestamp = UnitsService().get_rate_timestamp(unit_to_ureg)
-                kwargs = {'update_timestamp': timestamp}
-            elif UnitsCalculation.has_temperature(unit_converted):
-                UnitClass = TemperatureUnitsCalculation
-            else:
-                UnitClass = UnitsCalculation
 
-            items.append(
-                UnitClass(
-                    unit_converted,
-                    unit_from_ureg.units,
-                    unit_to_ureg,
-                    rate,
-                    query='{} {} to {}'.format(
-                        unit_from_ureg.magnitude,
+                kwargs = {}
+                if UnitsCalculation.is_currency(unit_converted):
+                    added_currency = True
+                    # Continue in if same units, it will be added later
+                    if unit_converted.units == unit_from_ureg.units:
+                        continue
+                    UnitClass = CurrencyUnitsCalculation
+                    timestamp = UnitsService().get_rate_timestamp(unit_to_ureg)
+                    kwargs = {'update_timestamp': timestamp}
+                elif UnitsCalculation.has_temperature(unit_converted):
+                    UnitClass = TemperatureUnitsCalculation
+                else:
+                    UnitClass = UnitsCalculation
+
+                items.append(
+                    UnitClass(
+                        unit_converted,
                         unit_from_ureg.units,
                         unit_to_ureg,
-                    ),
-                    order=len(items),
-                    **kwargs
+                        rate,
+                        query='{} {} to {}'.format(
+                            unit_from_ureg.magnitude,
+                            unit_from_ureg.units,
+                            unit_to_ureg,
+                        ),
+                        order=len(items),
+                        **kwargs
+                    )
                 )
-            )
 
         if unit_from_ureg_currency and added_currency:
             Q = ureg.Quantity
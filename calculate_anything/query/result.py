@@ -6,6 +6,16 @@ __all__ = ['QueryResult']
 
 
 class QueryResult:
+    __slots__ = (
+        'icon',
+        'name',
+        'description',
+        'clipboard',
+        'value',
+        'error',
+        'order',
+    )
+
     def __init__(
         self,
         icon: str = '',
@@ -14,6 +14,12 @@ UNIT_QUERY_SPLIT_RE = re.compile(r'\sto\s', flags=re.IGNORECASE)
 UNIT_SPLIT_RE = re.compile(r'([A-Za-z_]+)')
 UNIT_CURRENCY_RE = re.compile(r'currency_([A-Za-z]{3,})')
 UNIT_ALIASES_RE = re.compile(r'^[a-zA-Z_]+$')
+UNIT_ARITHMETIC_ONLY_RE = re.compile(r'^[\d\s.+\-*/()^]*$')
+UNIT_DIMENSIONALITY_RE = re.compile(r'\[(.*?)\]')
+UNIT_FORMAT_REPLACE = multi_re.compile({'**': '^', '_': ' '}, sort=False)
+UNIT_CURRENCY_FORMAT_REPLACE = multi_re.compile(
+    {'currency_': '', '**': '^', '_': ' '}, sort=True
+)
 
 CURRENCY_QUERY_REGEX = re.compile(
     r'^\s*(\d+\.?\d*)?\s*(.*)\s+(?:to|in)\s+(.*)$', flags=re.IGNORECASE
@@ -32,6 +38,23 @@ CALCULATOR_QUERY_REGEX_REPLACE = multi_re.compile(
 )
 CALCULATOR_REPLACE_LEADING_ZEROS = re.compile(r'(^|[\=\+\-\*\/\%])0+([1-9])')
 CALCULATOR_QUERY_SPLIT_EQUALITIES = re.compile(r'(==|>=|<=|>|<)')
+CALCULATOR_FORMAT_IMAGINARY_RE = re.compile(r'\d+j')
+CALCULATOR_FORMAT_SPLIT_RE = re.compile(
+    r'(\/\/|\*\*|\=\=|\>\=|\<\=|[\+\-\/\*\%\^\>\<])'
+)
+CALCULATOR_FORMAT_REPLACE = multi_re.compile(
+    {
+        '%': 'mod',
+        '//': 'div',
+        '**': '^',
+        '*': '×',
+        'sqrt': '√',
+        'pi': 'π',
+        'tau': 'τ',
+        '==': '=',
+    },
+    sort=True,
+)
 
 PERCENTAGES_REGEX_MATCH_NORMAL = re.compile(
     r'^\s*(.*)% of (.*)\s*$', flags=re.IGNORECASE
@@ -50,7 +73,11 @@ TIME_SUBQUERY_REGEX = re.compile(
     r'.*[^\W_0-9].*', flags=re.IGNORECASE | re.UNICODE
 )
 TIME_SPLIT_REGEX = re.compile(r'(\+|-)')
+TIME_NUMBER_ONLY_REGEX = re.compile(r'^\s*\d+\.?(\d+)?\s*$')
 TIME_AGO_BEFORE_REGEX = re.compile(r'\s(ago|before)(\s|$)')
 TIME_LOCATION_REPLACE_REGEX = re.compile(
     r'[\W_]+', flags=re.IGNORECASE | re.UNICODE
 )
+TIME_CITY_COUNTRY_REGEX = re.compile(
+    r'^(.*)\s+([a-z]{2,3})$', flags=re.IGNORECASE
+)
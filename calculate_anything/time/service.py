@@ -1,9 +1,9 @@
-import re
 from typing import List
 from calculate_anything.time.data import CityData
 from calculate_anything.time.sqlite_cache import TimezoneSqliteCache
 from calculate_anything.time.json_cache import TimezoneJsonCache
 from calculate_anything.utils import Singleton
+from calculate_anything.regex import TIME_CITY_COUNTRY_REGEX
 
 
 __all__ = ['TimezoneService']
@@ -32,14 +32,12 @@ class TimezoneService(metaclass=Singleton):
     def parse_default_cities_str(
         self, default_cities_str: str, save: bool = False
     ) -> List[CityData]:
-        regex = re.compile(r'^(.*)\s+([a-z]{2,3})$', flags=re.IGNORECASE)
-
         default_cities = default_cities_str.strip().split(',')
         cities = []
         for default_city in default_cities:
             default_city = default_city.strip().lower()
             # Check for country code. It is messy but avoids keeping a regex
-            matches = regex.findall(default_city)
+            matches = TIME_CITY_COUNTRY_REGEX.findall(default_city)
             country_code = None
             if matches:
                 default_city, country_code = matches[0]
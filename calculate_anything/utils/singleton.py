@@ -29,17 +29,23 @@ class Singleton(type):
 
         @wraps(func)
         def _wrapper(*args: Any, **kwargs: Any) -> Any:
-            if func not in cls._functions:
-                cls._functions[func] = func(*args, **kwargs)
-            return cls._functions[func]
+            try:
+                return cls._functions[func]
+            except KeyError:
+                pass
+            value = cls._functions[func] = func(*args, **kwargs)
+            return value
 
         return _wrapper
 
     def __call__(cls: Type[Any], *args: Any, **kwargs: Any) -> Any:
         '''Gets as input the class and args/kwargs and returns either an already
         instantiated object or a new object from that class'''
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(
-                *args, **kwargs
-            )
-        return cls._instances[cls]
+        # Instances are looked up on every call, so optimize for the hit path
+        try:
+            return cls._instances[cls]
+        except KeyError:
+            pass
+        instance = super(Singleton, cls).__call__(*args, **kwargs)
+        cls._instances[cls] = instance
+        return instance
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
+from threading import Lock, RLock, Timer
 from calculate_anything.utils.misc import images_dir
 from calculate_anything import logging
 from ulauncher.api.shared.action.CopyToClipboardAction import (
@@ -40,6 +42,10 @@ from calculate_anything.currency import CurrencyService
 logging.disable_stdout_handler()
 
 
+# Seconds to wait for more preference updates before committing them
+PREFERENCES_COMMIT_DELAY = 0.5
+
+
 class CalculateAnythingExtension(Extension):
     def __init__(self):
         super(CalculateAnythingExtension, self).__init__()
@@ -47,44 +53,123 @@ class CalculateAnythingExtension(Extension):
         self.subscribe(PreferencesEvent, PreferencesEventListener())
         self.subscribe(PreferencesUpdateEvent, PreferencesUpdateEventListener())
         self.subscribe(SystemExitEvent, SystemExitEventListener())
+        self.multi_handler = MultiHandler()
+        self.modes = {
+            'calculator': (
+                CalculatorQueryHandler().keyword,
+                (
+                    UnitsQueryHandler,
+                    CalculatorQueryHandler,
+                    PercentagesQueryHandler,
+                ),
+            ),
+            'time': (TimeQueryHandler().keyword, (TimeQueryHandler,)),
+            'dec': (Base10QueryHandler().keyword, (Base10QueryHandler,)),
+            'hex': (Base16QueryHandler().keyword, (Base16QueryHandler,)),
+            'oct': (Base8QueryHandler().keyword, (Base8QueryHandler,)),
+            'bin': (Base2QueryHandler().keyword, (Base2QueryHandler,)),
+        }
+        self.keyword_modes = {}
+        self._get_results_cached = lru_cache(maxsize=256)(self._get_results)
+        self._results_cache_version = 0
+        self._results_cache_lock = Lock()
+        self._placeholders = {}
+        LanguageService().add_update_callback(self._on_language_update)
+        self.preferences_lock = RLock()
+        self._commit_timer = None
+
+    def _get_results(self, mode, query, cache_version=None):
+        # cache_version is only part of the cache key, results computed
+        # before a cache clear are then never served afterwards
+        _, handlers = self.modes[mode]
+        return tuple(self.multi_handler.handle(query, *handlers))
+
+    def on_currency_update(self, data, had_error):
+        self.clear_results_cache()
+
+    def get_results(self, mode, query):
+        # Time results depend on the current time, so they are never cached
+        if mode == 'time':
+            return self._get_results(mode, query)
+        with self._results_cache_lock:
+            cache_version = self._results_cache_version
+        return self._get_results_cached(mode, query, cache_version)
+
+    def clear_results_cache(self):
+        with self._results_cache_lock:
+            self._results_cache_version += 1
+        self._get_results_cached.cache_clear()
+
+    def _on_language_update(self, lang):
+        self._placeholders.clear()
+
+    def get_placeholder(self, mode):
+        placeholder = self._placeholders.get(mode)
+        if placeholder is None:
+            placeholder = ExtensionResultItem(
+                icon=images_dir('icon.svg'),
+                name=LanguageService().translate('no-result', 'misc'),
+                description=LanguageService().translate(
+                    'no-result-{}-description'.format(mode), 'misc'
+                ),
+                highlightable=False,
+                on_enter=HideWindowAction(),
+            )
+            self._placeholders[mode] = placeholder
+        return placeholder
+
+    def _commit_preferences(self):
+        with self.preferences_lock, safe_operation('Commit preferences'):
+            self._commit_timer = None
+            Preferences().commit()
+            self.clear_results_cache()
+
+    def schedule_preferences_commit(self):
+        # Ulauncher sends one event per changed preference, so commit them
+        # together once no more updates arrive
+        with self.preferences_lock:
+            self.cancel_preferences_commit()
+            self._commit_timer = Timer(
+                PREFERENCES_COMMIT_DELAY, self._commit_preferences
+            )
+            self._commit_timer.daemon = True
+            self._commit_timer.start()
+
+    def cancel_preferences_commit(self):
+        with self.preferences_lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+
+    def update_keyword_modes(self):
+        # Later entries take precedence when two keywords are the same
+        self.keyword_modes = {
+            self.preferences['bin_kw']: 'bin',
+            self.preferences['oct_kw']: 'oct',
+            self.preferences['hex_kw']: 'hex',
+            self.preferences['dec_kw']: 'dec',
+            self.preferences['time_kw']: 'time',
+        }
 
 
 class KeywordQueryEventListener(EventListener):
     def on_event(self, event, extension):
-        query_nokw = event.get_argument() or ''
-        query = event.get_query() or ''
-        query = query.replace(event.get_keyword() + ' ', '', 1)
-        mode = 'calculator'
-        if event.get_keyword() == extension.preferences['time_kw']:
-            query = TimeQueryHandler().keyword + query
-            handlers = [TimeQueryHandler]
-            mode = 'time'
-        elif event.get_keyword() == extension.preferences['dec_kw']:
-            query = Base10QueryHandler().keyword + query
-            handlers = [Base10QueryHandler]
-            mode = 'dec'
-        elif event.get_keyword() == extension.preferences['hex_kw']:
-            query = Base16QueryHandler().keyword + query
-            handlers = [Base16QueryHandler]
-            mode = 'hex'
-        elif event.get_keyword() == extension.preferences['oct_kw']:
-            query = Base8QueryHandler().keyword + query
-            handlers = [Base8QueryHandler]
-            mode = 'oct'
-        elif event.get_keyword() == extension.preferences['bin_kw']:
-            query = Base2QueryHandler().keyword + query
-            handlers = [Base2QueryHandler]
-            mode = 'bin'
+        keyword, _, query_nokw = (event.get_query() or '').partition(' ')
+        mode = extension.keyword_modes.get(keyword, 'calculator')
+        # Only the time handler has results for an empty query, whitespace
+        # is still handled since the hex handler encodes it
+        if mode == 'time' or query_nokw:
+            handler_keyword, _ = extension.modes[mode]
+            # Preferences are committed from a timer thread, don't handle
+            # queries with half applied preferences
+            with extension.preferences_lock:
+                results = extension.get_results(
+                    mode, handler_keyword + query_nokw
+                )
         else:
-            query = CalculatorQueryHandler().keyword + query
-            handlers = [
-                UnitsQueryHandler,
-                CalculatorQueryHandler,
-                PercentagesQueryHandler,
-            ]
+            results = ()
 
         items = []
-        results = MultiHandler().handle(query, *handlers)
         for result in results:
             if result.clipboard is not None:
                 on_enter = CopyToClipboardAction(result.clipboard)
@@ -109,17 +194,7 @@ class KeywordQueryEventListener(EventListener):
         )
 
         if should_show_placeholder:
-            items.append(
-                ExtensionResultItem(
-                    icon=images_dir('icon.svg'),
-                    name=LanguageService().translate('no-result', 'misc'),
-                    description=LanguageService().translate(
-                        'no-result-{}-description'.format(mode), 'misc'
-                    ),
-                    highlightable=False,
-                    on_enter=HideWindowAction(),
-                )
-            )
+            items.append(extension.get_placeholder(mode))
 
         return RenderResultListAction(items)
 
@@ -128,6 +203,8 @@ class PreferencesEventListener(EventListener):
     def on_event(self, event, extension):
         super().on_event(event, extension)
 
+        extension.update_keyword_modes()
+
         preferences = Preferences()
 
         with safe_operation('Set language'):
@@ -159,6 +236,13 @@ class PreferencesEventListener(EventListener):
             preferences.currency.set_default_currencies(default_currencies)
 
         preferences.commit()
+        extension.clear_results_cache()
+
+        # Subscribe after the units service so that cached results are
+        # cleared only after new currency rates are in the unit registry
+        currency_service = CurrencyService()
+        currency_service.remove_update_callback(extension.on_currency_update)
+        currency_service.add_update_callback(extension.on_currency_update)
 
 
 class PreferencesUpdateEventListener(EventListener):
@@ -166,6 +250,16 @@ class PreferencesUpdateEventListener(EventListener):
     def on_event(self, event, extension):
         super().on_event(event, extension)
 
+        if event.id.endswith('_kw'):
+            extension.update_keyword_modes()
+            return
+
+        with extension.preferences_lock:
+            self._set_preference(event, extension)
+        extension.schedule_preferences_commit()
+
+    @staticmethod
+    def _set_preference(event, extension):
         preferences = Preferences()
 
         if event.id == 'cache':
@@ -189,11 +283,10 @@ class PreferencesUpdateEventListener(EventListener):
         elif event.id == 'units_conversion_mode':
             preferences.units.set_conversion_mode(event.new_value)
 
-        preferences.commit()
-
 
 class SystemExitEventListener(EventListener):
     def on_event(self, event, extension):
+        extension.cancel_preferences_commit()
         TimezoneService().stop()
         CurrencyService().stop()
         return super().on_event(event, extension)
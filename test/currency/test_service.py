@@ -0,0 +1,66 @@
+from threading import Event, RLock, Thread
+from calculate_anything.exceptions import CurrencyProviderException
+from calculate_anything.currency.cache import CurrencyCache
+from calculate_anything.currency.service import UpdateThread
+from calculate_anything.currency.providers.base import (
+    ApiKeyCurrencyProvider,
+    CurrencyData,
+    FreeCurrencyProvider,
+)
+from calculate_anything.currency.providers.combined import (
+    CombinedCurrencyProvider,
+)
+
+
+class FailingFreeProvider(FreeCurrencyProvider):
+    def request_currencies(self, *currencies, force=False) -> CurrencyData:
+        self.had_error = True
+        raise CurrencyProviderException('Failed')
+
+
+class BlockingApiProvider(ApiKeyCurrencyProvider):
+    def __init__(self) -> None:
+        super().__init__('api_key')
+        self.started = Event()
+        self.release = Event()
+
+    def request_currencies(self, *currencies, force=False) -> CurrencyData:
+        self.started.set()
+        self.release.wait(5)
+        self.had_error = False
+        return {'EUR': {'rate': 1.0, 'timestamp_refresh': 0}}
+
+
+def test_update_thread_does_not_lock_during_request():
+    api_provider = BlockingApiProvider()
+    provider = CombinedCurrencyProvider()
+    provider._free_providers = {FailingFreeProvider: FailingFreeProvider()}
+    provider.add_provider(api_provider)
+
+    cache = CurrencyCache()
+    cache._use_only_memory = True
+    lock = RLock()
+    results = []
+
+    def callback(data, had_error):
+        results.append((data, had_error))
+
+    update_thread = UpdateThread(cache, provider, callback, lock)
+    thread = Thread(target=update_thread._run, args=(True,))
+    thread.start()
+    assert api_provider.started.wait(5)
+
+    # The lock is free while requesting and providers can change meanwhile
+    assert lock.acquire(timeout=1)
+    try:
+        provider.remove_provider(api_provider)
+    finally:
+        lock.release()
+
+    api_provider.release.set()
+    thread.join(5)
+    assert not thread.is_alive()
+
+    assert results == [({'EUR': {'rate': 1.0, 'timestamp_refresh': 0}}, False)]
+    assert provider.had_error is False
+    assert provider.last_request_timestamp > 0
@@ -679,6 +679,8 @@ def test_provider_had_error(mock_currency_service, test_spec):
 
 test_special_cases_spec = [
     lambda _: {'query': '= 10', 'results': []},
+    lambda _: {'query': '= (1 + 2.5) * 3 / 4 ^ 2', 'results': []},
+    lambda _: {'query': '= 10 - 2 to 5', 'results': []},
     lambda _: {'query': '= 10 cm / cm', 'results': []},
     lambda _: {
         # Only on NORMAL mode